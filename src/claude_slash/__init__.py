@@ -23,10 +23,19 @@ Usage:
     /menuconfig                 # Configuration
 """
 
+from typing import Any
+
 __version__ = "1.5.0"
 __author__ = "Jeremy Eder"
 __email__ = "jeremyeder@users.noreply.github.com"
 
-from .main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the CLI app on first access so `import claude_slash` stays cheap."""
+    if name == "app":
+        from .main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
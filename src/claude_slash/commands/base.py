@@ -5,18 +5,18 @@ This module defines the BaseCommand abstract base class that all commands
 should inherit from to ensure consistent behavior and type safety.
 """
 
+import functools
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 import typer
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
 
-from ..ui import (
-    format_error_message,
-    format_info_message,
-    format_success_message,
-    format_warning_message,
-    get_console,
-)
+from ..ui import format_message_text, get_console
+
+# Same highlighting Console.print applies to plain strings by default
+_HIGHLIGHTER = ReprHighlighter()
 
 
 class BaseCommand(ABC):
@@ -27,9 +27,10 @@ class BaseCommand(ABC):
     ensuring type safety and consistent behavior across all commands.
     """
 
-    def __init__(self):
-        """Initialize the base command with a shared console for output."""
-        self.console = get_console()
+    @functools.cached_property
+    def console(self) -> Console:
+        """Return the shared console, fetched on first use."""
+        return get_console()
 
     @property
     @abstractmethod
@@ -68,6 +69,9 @@ class BaseCommand(ABC):
             """Wrapper function to handle command execution."""
             try:
                 self.execute(**kwargs)
+            except typer.Exit:
+                # self.error() already reported the problem; don't report it twice
+                raise
             except Exception as e:
                 self.console.print(
                     f"[bold red]Error executing {self.name}:[/bold red] " f"{str(e)}"
@@ -82,17 +86,26 @@ class BaseCommand(ABC):
 
     def error(self, message: str, details: Optional[str] = None) -> None:
         """Print an error message and exit."""
-        self.console.print(format_error_message(message, details))
+        self._print_message("error", message, details)
         raise typer.Exit(1)
 
     def success(self, message: str, details: Optional[str] = None) -> None:
         """Print a success message."""
-        self.console.print(format_success_message(message, details))
+        self._print_message("success", message, details)
 
     def info(self, message: str, details: Optional[str] = None) -> None:
         """Print an informational message."""
-        self.console.print(format_info_message(message, details))
+        self._print_message("info", message, details)
 
     def warning(self, message: str, details: Optional[str] = None) -> None:
         """Print a warning message."""
-        self.console.print(format_warning_message(message, details))
+        self._print_message("warning", message, details)
+
+    def _print_message(self, kind: str, message: str, details: Optional[str]) -> None:
+        """
+        Print a styled status message built by ui.format_message_text.
+
+        The default repr highlighting is still applied, as it would be for a
+        printed string.
+        """
+        self.console.print(_HIGHLIGHTER(format_message_text(kind, message, details)))
@@ -6,18 +6,256 @@ new GitHub repositories with best practices including CI/CD workflows,
 documentation sites, and security-first defaults.
 """
 
+import functools
+import io
+import json
 import os
+import select
+import shutil
 import subprocess
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from importlib import resources
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import typer
 
 from .base import BaseCommand
 
+GITHUB_HOST = "github.com"
+GITHUB_API_HOST = f"api.{GITHUB_HOST}"
+GITHUB_API_URL = f"https://{GITHUB_API_HOST}"
+
+# Methods that are safe to re-send when a kept-alive connection drops
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Prerequisite probes, paired with the error reported when each one fails
+_GH_AUTH_CHECK = (
+    ("gh", "auth", "status", "--hostname", GITHUB_HOST),
+    "GitHub CLI (gh) is not installed or not authenticated",
+)
+_GIT_CHECK = (("git", "--version"), "Git is not installed")
+
+# Hierarchical labels for the outcome management system: (name, color, description)
+_OUTCOME_LABELS = (
+    ("outcome", "6B46C1", "Top-level business outcomes that group related epics"),
+    ("epic", "F59E0B", "Major work items that deliver part of an outcome"),
+    ("story", "10B981", "Development tasks that implement part of an epic"),
+)
+
+# Bundled templates written by the project management setup
+_ISSUE_TEMPLATES = ("outcome.md", "epic.md", "story.md")
+_AUTOMATION_WORKFLOWS = ("project-automation.yml", "outcome-metrics.yml")
+
+# Branch protection applied to the default branch
+_BRANCH_PROTECTION = {
+    "required_status_checks": {"strict": True, "checks": []},
+    "enforce_admins": False,
+    "required_pull_request_reviews": {
+        "required_approving_review_count": 1,
+        "dismiss_stale_reviews": True,
+        "require_code_owner_reviews": False,
+    },
+    "restrictions": None,
+    "allow_force_pushes": False,
+    "allow_deletions": False,
+}
+
+# GraphQL documents for project board creation (Projects v2 has no REST API)
+_VIEWER_ID_QUERY = "query { viewer { id } }"
+_CREATE_PROJECT_MUTATION = """
+mutation($ownerId: ID!, $title: String!, $repositoryId: ID) {
+  createProjectV2(
+    input: {ownerId: $ownerId, title: $title, repositoryId: $repositoryId}
+  ) {
+    projectV2 { id }
+  }
+}
+"""
+_UPDATE_PROJECT_MUTATION = """
+mutation($projectId: ID!, $shortDescription: String!) {
+  updateProjectV2(
+    input: {projectId: $projectId, shortDescription: $shortDescription}
+  ) {
+    projectV2 { id }
+  }
+}
+"""
+
+# gitignore templates already looked up, kept for the life of the process
+_GITIGNORE_CACHE: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(*parts: str) -> str:
+    """
+    Read a template bundled in the claude_slash.templates package.
+
+    Templates are read on first use and cached for the life of the process.
+
+    Args:
+        *parts: Path segments relative to the templates package
+
+    Returns:
+        Template contents
+    """
+    template = resources.files("claude_slash.templates").joinpath(*parts)
+    return template.read_text(encoding="utf-8")
+
+
+def _write_file(path: Union[str, Path], content: str) -> None:
+    """
+    Write content to a file with a single unbuffered write.
+
+    Args:
+        path: File to create or truncate
+        content: Text to write, encoded as UTF-8
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    # Same base mode as open(), so the user's umask decides the permissions
+    fd = os.open(path, flags, 0o666)
+    try:
+        data = memoryview(content.encode("utf-8"))
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _write_files(files: List[Tuple[Path, str]]) -> None:
+    """
+    Write independent files concurrently.
+
+    Parent directories must already exist. Any write error is re-raised.
+
+    Args:
+        files: (path, content) pairs to write
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(_write_file, path, content) for path, content in files
+        ]
+        for future in futures:
+            future.result()
+
+
+@functools.lru_cache(maxsize=128)
+def _render_readme(
+    repo_name: str, description: Optional[str], license: Optional[str]
+) -> str:
+    """Render README.md content, reusing the result for identical options."""
+    return f"""# {repo_name}
+
+{description or ""}
+
+## Getting Started
+
+Add instructions for getting started with your project here.
+
+## Contributing
+
+Contributions are welcome! Please read our contributing guidelines.
+
+## License
+
+{license or "See LICENSE file for details."}
+"""
+
+
+def _env_github_token() -> Optional[str]:
+    """Return a GitHub token provided through the environment, if any."""
+    return os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+
+
+def _open_api_connection() -> Any:
+    """
+    Open a connection to the GitHub API, honoring the environment's proxy.
+
+    Like urllib, HTTPS_PROXY/https_proxy and NO_PROXY are respected; a proxy
+    is reached with an HTTP CONNECT tunnel.
+
+    Raises:
+        ValueError: If the configured HTTPS proxy has no host
+    """
+    # Imported here: http.client pulls in ssl and email parsing, which
+    # every CLI start would otherwise pay for via command discovery
+    import base64
+    import http.client
+    import urllib.parse
+    import urllib.request
+
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(GITHUB_API_HOST):
+        return http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    if not parts.hostname:
+        raise ValueError(f"HTTPS proxy setting {proxy!r} has no host")
+    tunnel_headers = {}
+    if parts.username is not None:
+        credentials = (
+            f"{urllib.parse.unquote(parts.username)}:"
+            f"{urllib.parse.unquote(parts.password or '')}"
+        )
+        tunnel_headers["Proxy-Authorization"] = (
+            f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"
+        )
+    conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=30)
+    conn.set_tunnel(GITHUB_API_HOST, 443, headers=tunnel_headers)
+    return conn
+
+
+def _describe_api_error(payload: bytes) -> str:
+    """Extract the message and per-field errors from a GitHub error body."""
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return ""
+    if not isinstance(data, dict):
+        return ""
+
+    details = [data["message"]] if data.get("message") else []
+    for error in data.get("errors") or []:
+        text = error.get("message") if isinstance(error, dict) else error
+        if text:
+            details.append(str(text))
+    return "; ".join(details)
+
+
+def _gitignore_cache_path(name: str) -> Optional[Path]:
+    """Return where a fetched gitignore template is cached, if it can be."""
+    if os.path.basename(name) != name or name.startswith("."):
+        return None  # Not a plain template name; don't build a path from it
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home, "claude-slash", "gitignore", f"{name}.gitignore")
+
+
+@functools.lru_cache(maxsize=None)
+def _check_prerequisite(cmd: Tuple[str, ...], message: str) -> None:
+    """
+    Run a prerequisite probe, raising RuntimeError with message if it fails.
+
+    Successful probes are cached for the life of the process. Failures raise
+    and are therefore not cached, so they are retried on the next call.
+    """
+    try:
+        # Only the exit status matters, so don't pipe and decode the output
+        result = subprocess.run(
+            list(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        raise RuntimeError(message) from None
+    if result.returncode != 0:
+        raise RuntimeError(message)
+
 
-@dataclass
+@dataclass(slots=True)
 class GitHubInitOptions:
     """Options for GitHub repository initialization."""
 
@@ -46,13 +284,27 @@ class GitHubInitOptions:
     install_claude_app: bool = True
 
 
+# Option names accepted as command keyword arguments; "private" comes from --public
+_OPTION_FIELDS = frozenset(
+    field.name for field in fields(GitHubInitOptions) if field.name != "private"
+)
+
+
 class GitHubInitialization:
     """Core GitHub repository initialization logic."""
 
     def __init__(self, options: GitHubInitOptions):
         self.options = options
         self.original_dir = os.getcwd()
-        self.created_files = []
+        self.created_files: List[str] = []
+        self._pending_writes: Dict[str, str] = {}
+        self._token: Optional[str] = None
+        self._github_user: Optional[str] = None
+        self._owner_node_id: Optional[str] = None
+        self._repo_node_id: Optional[str] = None
+        self._repo_created = False
+        self._idle_connections: List[Any] = []
+        self._connections_lock = threading.Lock()
 
     def execute(self) -> None:
         """Execute the repository initialization process."""
@@ -60,8 +312,13 @@ class GitHubInitialization:
             self._execute_dry_run()
             return
 
-        # Validate prerequisites before starting
-        self._validate_prerequisites()
+        # Validate prerequisites before starting; checking an environment token
+        # may already have opened an API connection, so don't leak it on failure
+        try:
+            self._validate_prerequisites()
+        except Exception:
+            self._close_connections()
+            raise
 
         try:
             print(f"🚀 Initializing GitHub repository: {self.options.repo_name}")
@@ -69,38 +326,52 @@ class GitHubInitialization:
             # Step 1: Initialize git repository
             self._init_git_repo()
 
-            # Step 2: Create initial files
-            self._create_initial_files()
+            # Creating the remote repository is a network round-trip that
+            # doesn't depend on the local files, so overlap it with them
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Step 2: Create GitHub repository
+                repo_future = executor.submit(self._create_github_repo)
+
+                # Step 3: Create initial files
+                self._create_initial_files()
+
+                # Step 4: Create GitHub Actions workflows
+                self._create_github_workflows()
 
-            # Step 3: Create GitHub Actions workflows
-            self._create_github_workflows()
+                # Step 5: Initialize Docusaurus if requested
+                if self.options.create_website:
+                    self._initialize_docusaurus()
 
-            # Step 4: Initialize Docusaurus if requested
-            if self.options.create_website:
-                self._initialize_docusaurus()
+                repo_future.result()
 
-            # Step 5: Create GitHub repository
-            self._create_github_repo()
+            # Steps 6-10 only need the remote repository to exist, so the
+            # network-bound ones run alongside the local file setup
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = []
 
-            # Step 6: Create GitHub project if requested
-            if self.options.create_project:
-                self._create_github_project()
+                # Step 6: Create GitHub project if requested
+                if self.options.create_project:
+                    futures.append(executor.submit(self._create_github_project))
 
-            # Step 7: Setup dependabot
-            if self.options.enable_dependabot:
-                self._setup_dependabot()
+                # Step 7: Setup dependabot
+                if self.options.enable_dependabot:
+                    self._setup_dependabot()
 
-            # Step 8: Install Claude GitHub App if enabled
-            self._install_claude_app()
+                # Step 8: Install Claude GitHub App if enabled
+                futures.append(executor.submit(self._install_claude_app))
 
-            # Step 9: Configure advanced automation
-            self._configure_automation()
+                # Step 9: Configure advanced automation
+                self._configure_automation()
 
-            # Step 10: Setup branch protection if enabled
-            if self.options.enable_branch_protection:
-                self._setup_branch_protection()
+                # Step 10: Setup branch protection if enabled
+                if self.options.enable_branch_protection:
+                    futures.append(executor.submit(self._setup_branch_protection))
 
-            # Step 11: Initial commit and push
+                for future in futures:
+                    future.result()
+
+            # Step 11: Write the generated files, then commit and push
+            self._flush_staged_writes()
             self._initial_commit_and_push()
 
             print(f"✅ Repository '{self.options.repo_name}' initialized successfully!")
@@ -113,34 +384,188 @@ class GitHubInitialization:
             print(f"❌ Error during initialization: {e}")
             self._rollback()
             raise
+        finally:
+            self._close_connections()
 
     def _validate_prerequisites(self) -> None:
         """Validate that all prerequisites are available."""
-        # Check if gh CLI is available and authenticated
-        result = subprocess.run(
-            ["gh", "auth", "status"], capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError("GitHub CLI (gh) is not installed or not authenticated")
-
-        # Check if git is available
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError("Git is not installed")
-
-        # Check if repo name already exists locally
+        # Check if repo name already exists locally; this is a single stat, so
+        # do it before spending any subprocess or network round-trips
         if Path(self.options.repo_name).exists():
             raise RuntimeError(f"Directory '{self.options.repo_name}' already exists")
 
+        # The probes are independent, so run them concurrently instead of
+        # paying for each subprocess spawn in turn
+        # With a token in the environment every GitHub call goes straight to
+        # the API, so gh isn't needed at all; check the token there instead
+        token_from_env = _env_github_token() is not None
+        checks = [_GIT_CHECK] if token_from_env else [_GH_AUTH_CHECK, _GIT_CHECK]
+
+        with ThreadPoolExecutor(max_workers=len(checks) + 1) as executor:
+            futures = [
+                executor.submit(_check_prerequisite, cmd, message)
+                for cmd, message in checks
+            ]
+            if token_from_env:
+                futures.insert(0, executor.submit(self._verify_env_token))
+
+        # Re-raise the first failure in check order
+        for future in futures:
+            future.result()
+
+    def _verify_env_token(self) -> None:
+        """Check that the environment token is valid."""
+        try:
+            user_data = self._github_api("GET", "/user")
+        except OSError as e:
+            raise RuntimeError(
+                f"GitHub token from GH_TOKEN/GITHUB_TOKEN could not be verified: {e}"
+            ) from None
+        # The verification already returned the login; keep it for later steps
+        self._github_user = user_data.get("login")
+
+    def _github_token(self) -> str:
+        """Get the GitHub token, asking gh for it at most once."""
+        if self._token is None:
+            self._token = _env_github_token()
+        if self._token is None:
+            # Requests always go to api.github.com, so ask for that host's token
+            # even when gh defaults to an enterprise host (GH_HOST). The token
+            # is a single ASCII line; skip locale-aware text decoding
+            result = subprocess.run(
+                ["gh", "auth", "token", "--hostname", GITHUB_HOST],
+                capture_output=True,
+                check=True,
+            )
+            self._token = result.stdout.split(b"\n", 1)[0].decode("ascii").strip()
+        return self._token
+
+    def _github_api(self, method: str, path: str, body: Optional[dict] = None) -> Any:
+        """
+        Call the GitHub REST API directly instead of spawning `gh api`.
+
+        Connections are kept alive and reused across calls, so only the first
+        request of each concurrent caller pays for the TLS handshake.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, ...)
+            path: API path, e.g. "/user"
+            body: Optional JSON request body
+
+        Returns:
+            Decoded JSON response, or None for empty responses
+
+        Raises:
+            urllib.error.HTTPError: If GitHub responds with an error status
+        """
+        # Deferred for the same start-up cost as in _open_api_connection
+        import http.client
+        import urllib.error
+
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {
+            "Authorization": f"Bearer {self._github_token()}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+            "User-Agent": "claude-slash",
+        }
+
+        conn, reused = self._checkout_connection()
+        try:
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+            except (ConnectionError, http.client.HTTPException):
+                # Only re-send requests that can't have side effects twice; a
+                # POST may already have been applied before the drop
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                # The server dropped the idle connection; retry on a fresh one
+                conn.close()
+                conn = _open_api_connection()
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+            payload = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        with self._connections_lock:
+            self._idle_connections.append(conn)
+
+        if response.status >= 400:
+            # Keep GitHub's explanation (e.g. "name already exists on this
+            # account") in the message, and the body readable for callers
+            detail = _describe_api_error(payload)
+            raise urllib.error.HTTPError(
+                f"{GITHUB_API_URL}{path}",
+                response.status,
+                f"{response.reason}: {detail}" if detail else response.reason,
+                response.headers,
+                io.BytesIO(payload),
+            )
+        return json.loads(payload) if payload else None
+
+    def _checkout_connection(self) -> Tuple[Any, bool]:
+        """Take an idle API connection, or open a new one; also say which."""
+        while True:
+            with self._connections_lock:
+                if not self._idle_connections:
+                    break
+                conn = self._idle_connections.pop()
+            # A readable idle socket means the server closed it (or sent
+            # something unexpected); drop it rather than send into it
+            if conn.sock is None or not select.select([conn.sock], [], [], 0)[0]:
+                return conn, True
+            conn.close()
+
+        return _open_api_connection(), False
+
+    def _close_connections(self) -> None:
+        """Close every idle API connection."""
+        with self._connections_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
+
+    def _github_graphql(self, query: str, variables: Optional[dict] = None) -> Any:
+        """
+        Run a GitHub GraphQL query over the same REST transport.
+
+        Args:
+            query: GraphQL document
+            variables: Optional query variables
+
+        Returns:
+            The response's "data" object
+
+        Raises:
+            RuntimeError: If GitHub reports GraphQL errors
+        """
+        result = self._github_api(
+            "POST", "/graphql", {"query": query, "variables": variables or {}}
+        )
+        if result.get("errors"):
+            raise RuntimeError(result["errors"][0].get("message", "GraphQL error"))
+        return result["data"]
+
     def _get_github_user(self) -> str:
-        """Get the current GitHub username."""
-        result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
-        if result.returncode == 0:
-            import json
+        """Get the current GitHub username, looking it up at most once."""
+        if self._github_user:
+            return self._github_user
+        import http.client
 
-            user_data = json.loads(result.stdout)
-            return user_data.get("login", "unknown")
-        return "unknown"
+        try:
+            user_data = self._github_api("GET", "/user")
+        except (
+            OSError,
+            ValueError,
+            http.client.HTTPException,
+            subprocess.CalledProcessError,
+        ):
+            return "unknown"  # Not cached, so a later call can retry
+        self._github_user = user_data.get("login")
+        return self._github_user or "unknown"
 
     def _init_git_repo(self) -> None:
         """Initialize a new git repository."""
@@ -148,8 +573,13 @@ class GitHubInitialization:
         os.makedirs(self.options.repo_name)
         os.chdir(self.options.repo_name)
 
-        subprocess.run(["git", "init"], check=True)
-        subprocess.run(["git", "branch", "-M", self.options.default_branch], check=True)
+        branch = self.options.default_branch
+        try:
+            # git >= 2.28 names the initial branch directly
+            subprocess.run(["git", "init", "-b", branch], check=True)
+        except subprocess.CalledProcessError:
+            subprocess.run(["git", "init"], check=True)
+            subprocess.run(["git", "branch", "-M", branch], check=True)
 
     def _create_initial_files(self) -> None:
         """Create initial files for the repository."""
@@ -162,237 +592,150 @@ class GitHubInitialization:
         if self.options.license:
             self._create_license()
 
+    def _stage(self, path: str, content: str) -> None:
+        """Queue a generated file to be written by _flush_staged_writes."""
+        self._pending_writes[path] = content
+
+    def _flush_staged_writes(self) -> None:
+        """Write every staged file in one batch."""
+        directories = {os.path.dirname(path) for path in self._pending_writes} - {""}
+        # makedirs creates parents too, so only the deepest directories are needed
+        for directory in directories:
+            if not any(other.startswith(directory + "/") for other in directories):
+                os.makedirs(directory, exist_ok=True)
+        _write_files([(Path(p), c) for p, c in self._pending_writes.items()])
+        self.created_files.extend(self._pending_writes)
+        self._pending_writes.clear()
+
     def _create_readme(self) -> None:
         """Create a README.md file."""
-        content = f"""# {self.options.repo_name}
+        content = _render_readme(
+            self.options.repo_name, self.options.description, self.options.license
+        )
+        self._stage("README.md", content)
 
-{self.options.description or ""}
+    def _create_gitignore(self) -> None:
+        """Create .gitignore file."""
+        content = None
 
-## Getting Started
+        # Look up the requested template, if a specific one was requested
+        if self.options.gitignore:
+            content = self._get_gitignore_template(self.options.gitignore)
 
-Add instructions for getting started with your project here.
+        # Use basic gitignore if no template specified or template fetch failed
+        if not content:
+            content = _load_template("gitignore", "basic.gitignore")
 
-## Contributing
+        # Write the content to .gitignore file
+        self._stage(".gitignore", content)
 
-Contributions are welcome! Please read our contributing guidelines.
+    def _get_gitignore_template(self, name: str) -> Optional[str]:
+        """
+        Get a gitignore template, fetching it from the API at most once.
 
-## License
+        Templates are cached in memory and on disk, so later runs on the same
+        machine don't need a network round-trip.
 
-{self.options.license or "See LICENSE file for details."}
-"""
-        with open("README.md", "w") as f:
-            f.write(content)
-        self.created_files.append("README.md")
+        Args:
+            name: Template name, e.g. "Python"
 
-    def _create_gitignore(self) -> None:
-        """Create .gitignore file."""
-        content = None
+        Returns:
+            Template contents, or None if it couldn't be fetched
+        """
+        if name in _GITIGNORE_CACHE:
+            return _GITIGNORE_CACHE[name]
 
-        # Use gh to get gitignore template if specific template was requested
-        if self.options.gitignore:
-            try:
-                result = subprocess.run(
-                    ["gh", "api", f"/gitignore/templates/{self.options.gitignore}"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    import json
+        cache_path = _gitignore_cache_path(name)
+        try:
+            content = cache_path.read_text(encoding="utf-8") if cache_path else None
+        except OSError:
+            content = None
 
-                    data = json.loads(result.stdout)
-                    content = data.get("source", "")
+        if content is None:
+            try:
+                data = self._github_api("GET", f"/gitignore/templates/{name}")
+                content = data.get("source", "")
             except Exception:
-                pass  # Will fall through to basic gitignore
+                return None  # Will fall through to basic gitignore
 
-        # Use basic gitignore if no template specified or template fetch failed
-        if not content:
-            basic_gitignore = """# Byte-compiled / optimized / DLL files
-__pycache__/
-*.py[cod]
-*$py.class
-
-# Distribution / packaging
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# PyInstaller
-*.manifest
-*.spec
-
-# Unit test / coverage reports
-htmlcov/
-.tox/
-.coverage
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-
-# Environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# OS
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-ehthumbs.db
-Thumbs.db
-"""
-            content = basic_gitignore
+            if content and cache_path:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(content, encoding="utf-8")
+                except OSError:
+                    pass  # The disk cache is best effort
 
-        # Write the content to .gitignore file
-        with open(".gitignore", "w") as f:
-            f.write(content)
-        self.created_files.append(".gitignore")
+        _GITIGNORE_CACHE[name] = content
+        return content
 
     def _create_license(self) -> None:
         """Create LICENSE file."""
         # For simplicity, create a basic MIT license placeholder
         # In a real implementation, you'd want to fetch the actual license text
-        content = f"""MIT License
-
-Copyright (c) 2025 {self._get_github_user()}
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-"""
-        with open("LICENSE", "w") as f:
-            f.write(content)
-        self.created_files.append("LICENSE")
+        content = _load_template("licenses", "MIT.txt").format(
+            year=time.localtime().tm_year, holder=self._get_github_user()
+        )
+        self._stage("LICENSE", content)
 
     def _create_github_workflows(self) -> None:
         """Create GitHub Actions workflows."""
-        workflows_dir = Path(".github/workflows")
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-
         # Create a basic CI workflow
-        ci_workflow = """name: CI
-
-on:
-  push:
-    branches: [ main ]
-  pull_request:
-    branches: [ main ]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-
-    steps:
-    - uses: actions/checkout@v4
-
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.11'
-
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install pytest
-        if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-        if [ -f requirements-test.txt ]; then pip install -r requirements-test.txt; fi
-
-    - name: Run tests
-      run: pytest
-"""
-
-        with open(workflows_dir / "ci.yml", "w") as f:
-            f.write(ci_workflow)
-        self.created_files.append(".github/workflows/ci.yml")
+        ci_workflow = _load_template("workflows", "ci.yml")
+        self._stage(".github/workflows/ci.yml", ci_workflow)
 
     def _initialize_docusaurus(self) -> None:
         """Initialize Docusaurus documentation site."""
         print("📚 Setting up Docusaurus documentation site...")
         # This is a placeholder - real implementation would need Node.js setup
-        docs_dir = Path("docs")
-        docs_dir.mkdir(exist_ok=True)
-
-        with open(docs_dir / "index.md", "w") as f:
-            f.write(
-                f"""# {self.options.repo_name} Documentation
+        self._stage(
+            "docs/index.md",
+            f"""# {self.options.repo_name} Documentation
 
 Welcome to the documentation for {self.options.repo_name}.
 
 ## Overview
 
 {self.options.description or "Add your project description here."}
-"""
-            )
-        self.created_files.append("docs/index.md")
+""",
+        )
 
     def _create_github_repo(self) -> None:
         """Create the GitHub repository."""
-        visibility = "private" if self.options.private else "public"
-
-        cmd = ["gh", "repo", "create", self.options.repo_name, f"--{visibility}"]
+        body = {"name": self.options.repo_name, "private": self.options.private}
 
         if self.options.description:
-            cmd.extend(["--description", self.options.description])
+            body["description"] = self.options.description
 
-        subprocess.run(cmd, check=True)
+        repo = self._github_api("POST", "/user/repos", body)
+        # From here on the repository is ours to delete on rollback
+        self._repo_created = True
+        # The new repository's owner is the authenticated user
+        self._github_user = repo["owner"]["login"]
+        self._owner_node_id = repo["owner"].get("node_id")
+        self._repo_node_id = repo.get("node_id")
 
     def _create_github_project(self) -> None:
         """Create GitHub project board with outcome management system."""
         print("📋 Creating GitHub project with outcome management...")
-        # Repository-level project creation
-        subprocess.run(
-            [
-                "gh",
-                "project",
-                "create",
-                "--title",
-                f"{self.options.repo_name} Development",
-                "--body",
-                f"Development tracking for {self.options.repo_name}",
-            ],
-            check=True,
+        # Repository-level project creation, linked to the new repository
+        owner_id = self._owner_node_id
+        if owner_id is None:
+            owner_id = self._github_graphql(_VIEWER_ID_QUERY)["viewer"]["id"]
+        data = self._github_graphql(
+            _CREATE_PROJECT_MUTATION,
+            {
+                "ownerId": owner_id,
+                "title": f"{self.options.repo_name} Development",
+                "repositoryId": self._repo_node_id,
+            },
+        )
+        description = f"Development tracking for {self.options.repo_name}"
+        self._github_graphql(
+            _UPDATE_PROJECT_MUTATION,
+            {
+                "projectId": data["createProjectV2"]["projectV2"]["id"],
+                "shortDescription": description,
+            },
         )
 
         # Create hierarchical labels for outcome management
@@ -408,462 +751,56 @@ Welcome to the documentation for {self.options.repo_name}.
         """Create hierarchical labels for outcome management system."""
         print("🏷️  Creating outcome management labels...")
 
-        labels = [
-            (
-                "outcome",
-                "6B46C1",
-                "Top-level business outcomes that group related epics",
-            ),
-            ("epic", "F59E0B", "Major work items that deliver part of an outcome"),
-            ("story", "10B981", "Development tasks that implement part of an epic"),
-        ]
+        # Each label is an independent API call, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(_OUTCOME_LABELS)) as executor:
+            futures = [
+                executor.submit(self._create_label, *label) for label in _OUTCOME_LABELS
+            ]
+            for future in futures:
+                future.result()
+
+    def _create_label(self, name: str, color: str, description: str) -> None:
+        """Create a label, updating it instead if it already exists."""
+        # The repository was created over REST and has no origin remote yet,
+        # so address it explicitly rather than relying on gh's repo detection
+        import http.client
+        import urllib.parse
 
-        for name, color, description in labels:
+        user = self._get_github_user()
+        labels_path = f"/repos/{user}/{self.options.repo_name}/labels"
+        label = {"name": name, "color": color, "description": description}
+        try:
+            self._github_api("POST", labels_path, label)
+        except (OSError, http.client.HTTPException):
+            # Label might already exist, try to update it
             try:
-                subprocess.run(
-                    [
-                        "gh",
-                        "label",
-                        "create",
-                        name,
-                        "--color",
-                        color,
-                        "--description",
-                        description,
-                    ],
-                    check=True,
+                self._github_api(
+                    "PATCH", f"{labels_path}/{urllib.parse.quote(name)}", label
                 )
-            except subprocess.CalledProcessError:
-                # Label might already exist, try to update it
-                subprocess.run(
-                    [
-                        "gh",
-                        "label",
-                        "edit",
-                        name,
-                        "--color",
-                        color,
-                        "--description",
-                        description,
-                    ],
-                    check=False,
-                )  # Don't fail if update doesn't work
+            except (OSError, http.client.HTTPException) as e:
+                # A missing label is cosmetic; don't roll back the repository
+                print(f"⚠️ Warning: Could not create label '{name}': {e}")
 
     def _create_issue_templates(self) -> None:
         """Create issue templates for outcome/epic/story hierarchy."""
         print("📋 Creating issue templates...")
 
-        template_dir = Path(".github/ISSUE_TEMPLATE")
-        template_dir.mkdir(parents=True, exist_ok=True)
-
-        # Outcome template
-        outcome_template = """---
-name: 💼 Outcome
-about: Create a new business outcome that groups related epics
-title: 'Outcome: [Brief description]'
-labels: ["outcome"]
-assignees: []
----
-
-## 🎯 Business Outcome
-
-**Brief Description:** What business value will this outcome deliver?
-
-## 📊 Success Metrics
-
-- [ ] Metric 1: [Quantifiable measure]
-- [ ] Metric 2: [Quantifiable measure]
-- [ ] Metric 3: [Quantifiable measure]
-
-## 🎨 Scope & Context
-
-**Problem Statement:** What problem does this solve?
-
-**User Impact:** Who benefits and how?
-
-**Strategic Alignment:** How does this align with business objectives?
-
-## 🗺️ Related Epics
-
-This outcome will be delivered through the following epics:
-
-- [ ] Epic: [Link to epic issue]
-- [ ] Epic: [Link to epic issue]
-- [ ] Epic: [Link to epic issue]
-
-## ✅ Definition of Done
-
-- [ ] All epics under this outcome are completed
-- [ ] Success metrics are achieved and validated
-- [ ] User acceptance testing passed
-- [ ] Documentation updated
-- [ ] Stakeholder sign-off obtained
-
-## 📝 Notes
-
-[Additional context, assumptions, or constraints]
-"""
-
-        # Epic template
-        epic_template = """---
-name: 🚀 Epic
-about: Create a new epic under a business outcome
-title: 'Epic: [Brief description]'
-labels: ["epic"]
-assignees: []
----
-
-## 🎯 Epic Overview
-
-**Parent Outcome:** [Link to outcome issue]
-
-**Brief Description:** What major capability will this epic deliver?
-
-## 📋 Scope & Requirements
-
-**Functional Requirements:**
-- [ ] Requirement 1
-- [ ] Requirement 2
-- [ ] Requirement 3
-
-**Non-Functional Requirements:**
-- [ ] Performance: [Specific targets]
-- [ ] Security: [Security considerations]
-- [ ] Scalability: [Scale requirements]
-
-## 🏗️ Implementation Approach
-
-**Architecture:** [High-level architectural approach]
-
-**Technology Stack:** [Key technologies/frameworks]
-
-**Integration Points:** [Systems this epic integrates with]
-
-## 📊 Stories & Tasks
-
-This epic will be implemented through the following stories:
-
-- [ ] Story: [Link to story issue]
-- [ ] Story: [Link to story issue]
-- [ ] Story: [Link to story issue]
-
-## 🧪 Testing Strategy
-
-- [ ] Unit tests
-- [ ] Integration tests
-- [ ] End-to-end tests
-
-## ✅ Definition of Done
-
-- [ ] All stories under this epic are completed
-- [ ] Code review completed and approved
-- [ ] All tests passing
-- [ ] Documentation updated
-- [ ] Feature deployed to production
-
-## 📝 Notes
-
-[Technical notes, architectural decisions, or implementation details]
-"""
-
-        # Story template
-        story_template = """---
-name: 📋 Story
-about: Create a new development story under an epic
-title: 'Story: [Brief description]'
-labels: ["story"]
-assignees: []
----
-
-## 🎯 Story Overview
-
-**Parent Epic:** [Link to epic issue]
-
-**User Story:** As a [user type], I want [functionality] so that [benefit].
-
-## 📋 Acceptance Criteria
-
-- [ ] Given [context], when [action], then [expected result]
-- [ ] Given [context], when [action], then [expected result]
-- [ ] Given [context], when [action], then [expected result]
-
-## 🔧 Technical Requirements
-
-**Implementation Details:**
-- [ ] [Specific technical requirement]
-- [ ] [Specific technical requirement]
-- [ ] [Specific technical requirement]
-
-## 🧪 Test Plan
-
-**Unit Tests:**
-- [ ] Test case 1
-- [ ] Test case 2
-
-**Integration Tests:**
-- [ ] Integration scenario 1
-- [ ] Integration scenario 2
-
-## ✅ Definition of Done
-
-- [ ] Code implemented and tested
-- [ ] Unit tests written and passing
-- [ ] Integration tests written and passing
-- [ ] Code review completed
-- [ ] Documentation updated
-
-## 📝 Notes
-
-[Implementation notes, technical considerations, or edge cases]
-"""
-
-        # Write templates to files
-        templates = [
-            ("outcome.md", outcome_template),
-            ("epic.md", epic_template),
-            ("story.md", story_template),
-        ]
-
-        for filename, content in templates:
-            template_path = template_dir / filename
-            with open(template_path, "w") as f:
-                f.write(content)
-            self.created_files.append(f".github/ISSUE_TEMPLATE/{filename}")
+        for name in _ISSUE_TEMPLATES:
+            self._stage(
+                f".github/ISSUE_TEMPLATE/{name}",
+                _load_template("issue_templates", name),
+            )
 
     def _create_project_automation(self) -> None:
         """Create GitHub Actions workflows for project automation."""
         print("🤖 Creating project automation workflows...")
 
-        workflow_dir = Path(".github/workflows")
-        workflow_dir.mkdir(parents=True, exist_ok=True)
-
-        # Project automation workflow
-        automation_workflow = """name: Project Automation
-
-on:
-  issues:
-    types: [opened, edited, labeled, unlabeled, closed, reopened]
-  issue_comment:
-    types: [created]
-
-permissions:
-  issues: write
-  repository-projects: write
-  contents: read
-
-jobs:
-  add-to-project:
-    runs-on: ubuntu-latest
-    if: github.event_name == 'issues' && github.event.action == 'opened'
-    steps:
-      - name: Add issue to project
-        uses: actions/add-to-project@v0.5.0
-        with:
-          project-url: https://github.com/users/${{ github.repository_owner }}/projects
-          github-token: ${{ secrets.GITHUB_TOKEN }}
-
-  hierarchy-validation:
-    runs-on: ubuntu-latest
-    if: github.event_name == 'issues' && (github.event.action == 'opened' || github.event.action == 'labeled')
-    steps:
-      - name: Validate hierarchy labels
-        uses: actions/github-script@v6
-        with:
-          script: |
-            const { owner, repo, number } = context.issue;
-            const issue = await github.rest.issues.get({
-              owner,
-              repo,
-              issue_number: number
-            });
-
-            const labels = issue.data.labels.map(l => l.name);
-            const hasOutcome = labels.includes('outcome');
-            const hasEpic = labels.includes('epic');
-            const hasStory = labels.includes('story');
-
-            // Validate hierarchy rules
-            const hierarchyCount = [hasOutcome, hasEpic, hasStory].filter(Boolean).length;
-
-            if (hierarchyCount > 1) {
-              await github.rest.issues.createComment({
-                owner,
-                repo,
-                issue_number: number,
-                body: '⚠️ **Hierarchy Validation**: Issues should have only one hierarchy label (outcome, epic, or story). Please remove conflicting labels.'
-              });
-            }
-
-  update-outcome-progress:
-    runs-on: ubuntu-latest
-    if: github.event_name == 'issues' && (github.event.action == 'closed' || github.event.action == 'reopened')
-    steps:
-      - name: Update parent outcome progress
-        uses: actions/github-script@v6
-        with:
-          script: |
-            const { owner, repo, number } = context.issue;
-            const issue = await github.rest.issues.get({
-              owner,
-              repo,
-              issue_number: number
-            });
-
-            const labels = issue.data.labels.map(l => l.name);
-            const isEpic = labels.includes('epic');
-
-            if (isEpic && issue.data.body) {
-              // Look for parent outcome reference in the body
-              const outcomeMatch = issue.data.body.match(/\\*\\*Parent Outcome:\\*\\* #(\\d+)/);
-              if (outcomeMatch) {
-                const outcomeNumber = parseInt(outcomeMatch[1]);
-
-                // Get all epics for this outcome
-                const epics = await github.rest.search.issuesAndPullRequests({
-                  q: `repo:${owner}/${repo} is:issue label:epic "Parent Outcome: #${outcomeNumber}"`
-                });
-
-                const totalEpics = epics.data.total_count;
-                const closedEpics = epics.data.items.filter(epic => epic.state === 'closed').length;
-                const progressPercent = totalEpics > 0 ? Math.round((closedEpics / totalEpics) * 100) : 0;
-
-                // Comment on outcome with progress update
-                await github.rest.issues.createComment({
-                  owner,
-                  repo,
-                  issue_number: outcomeNumber,
-                  body: `📊 **Progress Update**: ${closedEpics}/${totalEpics} epics completed (${progressPercent}%)`
-                });
-              }
-            }
-"""
-
-        # Outcome metrics workflow
-        metrics_workflow = """name: Outcome Metrics Dashboard
-
-on:
-  schedule:
-    - cron: '0 6 * * 1'  # Weekly on Mondays at 6 AM UTC
-  workflow_dispatch:  # Allow manual triggers
-
-jobs:
-  generate-metrics:
-    runs-on: ubuntu-latest
-    steps:
-      - name: Generate outcome metrics report
-        uses: actions/github-script@v6
-        with:
-          script: |
-            const { owner, repo } = context.repo;
-
-            // Get all outcomes
-            const outcomes = await github.rest.search.issuesAndPullRequests({
-              q: `repo:${owner}/${repo} is:issue label:outcome`
-            });
-
-            let metricsReport = `# 📊 Outcome Metrics Report\\n\\n`;
-            metricsReport += `*Generated: ${new Date().toISOString().split('T')[0]}*\\n\\n`;
-            metricsReport += `## Summary\\n\\n`;
-            metricsReport += `- **Total Outcomes**: ${outcomes.data.total_count}\\n`;
-
-            let completedOutcomes = 0;
-            let activeOutcomes = 0;
-            let plannedOutcomes = 0;
-
-            for (const outcome of outcomes.data.items) {
-              // Get epics for this outcome
-              const epics = await github.rest.search.issuesAndPullRequests({
-                q: `repo:${owner}/${repo} is:issue label:epic "Parent Outcome: #${outcome.number}"`
-              });
-
-              const totalEpics = epics.data.total_count;
-              const closedEpics = epics.data.items.filter(epic => epic.state === 'closed').length;
-              const progressPercent = totalEpics > 0 ? Math.round((closedEpics / totalEpics) * 100) : 0;
-
-              if (progressPercent === 100) {
-                completedOutcomes++;
-              } else if (progressPercent > 0) {
-                activeOutcomes++;
-              } else {
-                plannedOutcomes++;
-              }
-
-              metricsReport += `\\n## ${outcome.title}\\n`;
-              metricsReport += `- **Progress**: ${closedEpics}/${totalEpics} epics (${progressPercent}%)\\n`;
-              metricsReport += `- **Status**: ${outcome.state}\\n`;
-              metricsReport += `- **Link**: [#${outcome.number}](${outcome.html_url})\\n`;
-            }
-
-            metricsReport += `\\n## Overall Status\\n`;
-            metricsReport += `- **Completed**: ${completedOutcomes}\\n`;
-            metricsReport += `- **Active**: ${activeOutcomes}\\n`;
-            metricsReport += `- **Planned**: ${plannedOutcomes}\\n`;
-
-            // Create or update metrics issue
-            try {
-              const existingIssue = await github.rest.search.issuesAndPullRequests({
-                q: `repo:${owner}/${repo} is:issue in:title "Outcome Metrics Dashboard"`
-              });
-
-              if (existingIssue.data.total_count > 0) {
-                // Update existing dashboard issue
-                await github.rest.issues.update({
-                  owner,
-                  repo,
-                  issue_number: existingIssue.data.items[0].number,
-                  body: metricsReport
-                });
-              } else {
-                // Create new dashboard issue
-                await github.rest.issues.create({
-                  owner,
-                  repo,
-                  title: '📊 Outcome Metrics Dashboard',
-                  body: metricsReport,
-                  labels: ['metrics', 'dashboard']
-                });
-              }
-            } catch (error) {
-              console.error('Error managing metrics dashboard:', error);
-            }
-"""
-
-        # Write workflows to files
-        workflows = [
-            ("project-automation.yml", automation_workflow),
-            ("outcome-metrics.yml", metrics_workflow),
-        ]
-
-        for filename, content in workflows:
-            workflow_path = workflow_dir / filename
-            with open(workflow_path, "w") as f:
-                f.write(content)
-            self.created_files.append(f".github/workflows/{filename}")
+        for name in _AUTOMATION_WORKFLOWS:
+            self._stage(f".github/workflows/{name}", _load_template("workflows", name))
 
     def _setup_dependabot(self) -> None:
         """Setup Dependabot configuration."""
-        dependabot_dir = Path(".github")
-        dependabot_dir.mkdir(exist_ok=True)
-
-        dependabot_config = """version: 2
-updates:
-  - package-ecosystem: "pip"
-    directory: "/"
-    schedule:
-      interval: "weekly"
-    reviewers:
-      - "@me"
-  - package-ecosystem: "github-actions"
-    directory: "/"
-    schedule:
-      interval: "weekly"
-    reviewers:
-      - "@me"
-"""
-
-        with open(dependabot_dir / "dependabot.yml", "w") as f:
-            f.write(dependabot_config)
-        self.created_files.append(".github/dependabot.yml")
+        self._stage(".github/dependabot.yml", _load_template("dependabot.yml"))
 
     def _setup_branch_protection(self) -> None:
         """Setup branch protection rules for the main branch."""
@@ -872,37 +809,15 @@ updates:
         user = self._get_github_user()
         repo_full_name = f"{user}/{self.options.repo_name}"
 
-        try:
-            # Create branch protection rule using GitHub CLI
-            cmd = [
-                "gh",
-                "api",
-                "--method",
-                "PUT",
-                f"/repos/{repo_full_name}/branches/{self.options.default_branch}/protection",
-                "--field",
-                'required_status_checks={"strict":true,"checks":[]}',
-                "--field",
-                "enforce_admins=false",
-                "--field",
-                'required_pull_request_reviews={"required_approving_review_count":1,"dismiss_stale_reviews":true,"require_code_owner_reviews":false}',
-                "--field",
-                "restrictions=null",
-                "--field",
-                "allow_force_pushes=false",
-                "--field",
-                "allow_deletions=false",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0:
-                print("✅ Branch protection rules configured successfully")
-            else:
-                print(f"⚠️ Warning: Could not set up branch protection: {result.stderr}")
+        path = (
+            f"/repos/{repo_full_name}/branches/{self.options.default_branch}/protection"
+        )
 
+        try:
+            self._github_api("PUT", path, _BRANCH_PROTECTION)
+            print("✅ Branch protection rules configured successfully")
         except Exception as e:
-            print(f"⚠️ Warning: Failed to setup branch protection: {e}")
+            print(f"⚠️ Warning: Could not set up branch protection: {e}")
 
     def _install_claude_app(self) -> None:
         """Install Claude GitHub App for AI-powered code reviews."""
@@ -951,55 +866,57 @@ updates:
 
     def _initial_commit_and_push(self) -> None:
         """Make initial commit and push to GitHub."""
-        subprocess.run(["git", "add", "."], check=True)
+        user = self._get_github_user()
+        remote_url = f"git@{GITHUB_HOST}:{user}/{self.options.repo_name}.git"
+
+        # Stage only what we generated, so git doesn't rescan the whole tree
+        subprocess.run(["git", "add", "--", *self.created_files], check=True)
         subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
 
         # Add remote and push
-        user = self._get_github_user()
-        subprocess.run(
-            [
-                "git",
-                "remote",
-                "add",
-                "origin",
-                f"git@github.com:{user}/{self.options.repo_name}.git",
-            ],
-            check=True,
-        )
+        subprocess.run(["git", "remote", "add", "origin", remote_url], check=True)
         subprocess.run(
             ["git", "push", "-u", "origin", self.options.default_branch], check=True
         )
 
     def _execute_dry_run(self) -> None:
         """Show what would be created without actually creating it."""
-        print("🔍 DRY RUN MODE - Preview of what would be created:")
-        print(f"📦 Repository name: {self.options.repo_name}")
-        print(f"🔒 Visibility: {'private' if self.options.private else 'public'}")
+        # Build the whole preview first and emit it with a single write
+        lines = [
+            "🔍 DRY RUN MODE - Preview of what would be created:",
+            f"📦 Repository name: {self.options.repo_name}",
+            f"🔒 Visibility: {'private' if self.options.private else 'public'}",
+        ]
         if self.options.description:
-            print(f"📝 Description: {self.options.description}")
-        print(f"📄 README: {'✓' if self.options.readme else '✗'}")
-        print(f"🚫 .gitignore: {self.options.gitignore or 'basic'}")
+            lines.append(f"📝 Description: {self.options.description}")
+        lines.append(f"📄 README: {'✓' if self.options.readme else '✗'}")
+        lines.append(f"🚫 .gitignore: {self.options.gitignore or 'basic'}")
         if self.options.license:
-            print(f"📜 License: {self.options.license}")
-        print(f"🌐 Website: {'✓' if self.options.create_website else '✗'}")
-        print(f"📋 Project board: {'✓' if self.options.create_project else '✗'}")
-        print(f"🤖 Dependabot: {'✓' if self.options.enable_dependabot else '✗'}")
-        print(
-            f"🛡️ Branch protection: {'✓' if self.options.enable_branch_protection else '✗'}"
+            lines.append(f"📜 License: {self.options.license}")
+        lines.extend(
+            [
+                f"🌐 Website: {'✓' if self.options.create_website else '✗'}",
+                f"📋 Project board: {'✓' if self.options.create_project else '✗'}",
+                f"🤖 Dependabot: {'✓' if self.options.enable_dependabot else '✗'}",
+                f"🛡️ Branch protection: "
+                f"{'✓' if self.options.enable_branch_protection else '✗'}",
+                f"🤖 Claude GitHub App: "
+                f"{'✓' if self.options.install_claude_app else '✗'}",
+                # New outcome management features
+                "\n🎯 Outcome Management System:",
+                "   🏷️  Hierarchical labels: outcome, epic, story",
+                "   📋 Issue templates: outcome.md, epic.md, story.md",
+                "   🤖 Project automation workflow",
+                "   📊 Weekly metrics dashboard",
+                "\n🎯 GitHub Actions workflows:",
+                "   🚀 CI/CD pipeline",
+                "   📋 Project automation",
+                "   📊 Outcome metrics dashboard",
+            ]
         )
-        print(f"🤖 Claude GitHub App: {'✓' if self.options.install_claude_app else '✗'}")
-
-        # New outcome management features
-        print("\n🎯 Outcome Management System:")
-        print("   🏷️  Hierarchical labels: outcome, epic, story")
-        print("   📋 Issue templates: outcome.md, epic.md, story.md")
-        print("   🤖 Project automation workflow")
-        print("   📊 Weekly metrics dashboard")
 
-        print("\n🎯 GitHub Actions workflows:")
-        print("   🚀 CI/CD pipeline")
-        print("   📋 Project automation")
-        print("   📊 Outcome metrics dashboard")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def _rollback(self) -> None:
         """Rollback changes on failure."""
@@ -1009,27 +926,30 @@ updates:
             # Change back to original directory
             os.chdir(self.original_dir)
 
-            # Try to delete the GitHub repository if it was created
-            try:
-                user = self._get_github_user()
-                subprocess.run(
-                    [
-                        "gh",
-                        "repo",
-                        "delete",
-                        f"{user}/{self.options.repo_name}",
-                        "--yes",
-                    ],
-                    capture_output=True,
-                )
-            except Exception:
-                pass
-
-            # Remove local directory
-            import shutil
-
-            if Path(self.options.repo_name).exists():
-                shutil.rmtree(self.options.repo_name)
+            # Remove the local directory while the remote repository is being
+            # deleted; a partially removed or already missing tree shouldn't
+            # abort the rest of the rollback
+            remover = threading.Thread(
+                target=shutil.rmtree,
+                args=(self.options.repo_name,),
+                kwargs={"ignore_errors": True},
+            )
+            remover.start()
+
+            # Delete the GitHub repository only if this run created it; a
+            # failed create may mean the name belongs to an existing repository
+            if self._repo_created:
+                try:
+                    user = self._get_github_user()
+                    self._github_api(
+                        "DELETE", f"/repos/{user}/{self.options.repo_name}"
+                    )
+                except Exception:
+                    pass
+
+            remover.join()
+            if os.path.exists(self.options.repo_name):
+                print(f"⚠️ Warning: Could not fully remove '{self.options.repo_name}'")
 
         except Exception as e:
             print(f"⚠️ Error during rollback: {e}")
@@ -1106,24 +1026,12 @@ class GitHubInitCommand(BaseCommand):
                 self.error("Repository name is required")
                 return
 
-            # Build options from arguments
-            options = GitHubInitOptions(
-                repo_name=repo_name,
-                description=kwargs.get("description"),
-                private=not kwargs.get("public", False),
-                license=kwargs.get("license"),
-                gitignore=kwargs.get("gitignore"),
-                readme=kwargs.get("readme", True),
-                create_website=kwargs.get("create_website", False),
-                enable_dependabot=kwargs.get("enable_dependabot", True),
-                dry_run=kwargs.get("dry_run", False),
-                create_project=kwargs.get("create_project", True),
-                enable_auto_version=kwargs.get("enable_auto_version", True),
-                enable_auto_merge=kwargs.get("enable_auto_merge", True),
-                enable_auto_release=kwargs.get("enable_auto_release", True),
-                enable_branch_protection=kwargs.get("enable_branch_protection", True),
-                install_claude_app=kwargs.get("install_claude_app", True),
-            )
+            # Build options from arguments, leaving unset ones at their defaults
+            overrides = {
+                name: kwargs[name] for name in _OPTION_FIELDS if name in kwargs
+            }
+            overrides["private"] = not kwargs.get("public", False)
+            options = GitHubInitOptions(**overrides)
 
             # Execute the initialization
             initializer = GitHubInitialization(options)
@@ -1131,6 +1039,9 @@ class GitHubInitCommand(BaseCommand):
 
             self.success(f"Repository '{repo_name}' initialized successfully!")
 
+        except typer.Exit:
+            # self.error() already reported the problem; don't report it twice
+            raise
         except Exception as e:
             self.error(f"Failed to initialize repository: {str(e)}")
 
@@ -1220,6 +1131,8 @@ class GitHubInitCommand(BaseCommand):
                     enable_branch_protection=enable_branch_protection,
                     install_claude_app=install_claude_app,
                 )
+            except typer.Exit:
+                raise
             except Exception as e:
                 self.console.print(
                     f"[bold red]Error executing {self.name}:[/bold red] {str(e)}"
@@ -5,6 +5,7 @@ This module provides an interactive interface for analyzing current
 session context to extract insights and integrate them into CLAUDE.md.
 """
 
+import bisect
 import shutil
 import subprocess
 from datetime import datetime
@@ -54,6 +55,8 @@ class LearnCommand(BaseCommand):
         super().__init__()
         self.claude_md_path = Path.home() / ".claude" / "CLAUDE.md"
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._lines: List[str] = []
+        self._header_index: List[int] = []
 
     def execute(self, **kwargs) -> None:
         """Execute the learn command."""
@@ -173,24 +176,32 @@ Context: {repo_name}"""
         shutil.copy2(self.claude_md_path, backup_path)
         return backup_path
 
+    def _load_claude_md(self) -> None:
+        """Read CLAUDE.md once and index its header lines."""
+        with open(self.claude_md_path, "r", encoding="utf-8") as f:
+            self._lines = f.readlines()
+        self._header_index = [
+            i for i, line in enumerate(self._lines) if line.startswith("#")
+        ]
+
+    def _section_end(self, start_line: int) -> int:
+        """Return the index of the next header after start_line, or EOF."""
+        pos = bisect.bisect_right(self._header_index, start_line)
+        if pos < len(self._header_index):
+            return self._header_index[pos]
+        return len(self._lines)
+
     def _parse_claude_md_structure(self) -> List[dict]:
         """Parse CLAUDE.md structure to extract sections."""
         self.console.print("[cyan]📖 Analyzing CLAUDE.md structure...[/cyan]")
 
-        sections = []
-        with open(self.claude_md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        self._load_claude_md()
 
-        for line_num, line in enumerate(lines, 1):
-            if line.startswith("#"):
-                sections.append(
-                    {"line_num": line_num, "header": line.strip(), "type": "existing"}
-                )
-                # Limit to first 20 sections for display
-                if len(sections) >= 20:
-                    break
-
-        return sections
+        # Limit to first 20 sections for display
+        return [
+            {"line_num": i + 1, "header": self._lines[i].strip(), "type": "existing"}
+            for i in self._header_index[:20]
+        ]
 
     def _interactive_section_selection(self, sections: List[dict]) -> Optional[dict]:
         """Interactive section selection interface."""
@@ -318,19 +329,11 @@ Context: {repo_name}"""
         """Show section content for manual integration."""
         self.console.print("[yellow]📖 Current section content:[/yellow]")
 
-        # Read and display current section content
-        with open(self.claude_md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
+        # Display current section content from the already loaded file
         start_line = section["line_num"] - 1
-        # Find next section or end of file
-        end_line = len(lines)
-        for i in range(start_line + 1, len(lines)):
-            if lines[i].startswith("#"):
-                end_line = i
-                break
-
-        section_content = "".join(lines[start_line:end_line])
+        end_line = self._section_end(start_line)
+
+        section_content = "".join(self._lines[start_line:end_line])
         self.console.print(Panel(section_content, style="dim"))
 
         self.console.print()
@@ -350,13 +353,9 @@ Context: {repo_name}"""
         self, section_name: str, formatted_learning: str
     ) -> None:
         """Integrate learning as a new section."""
-        with open(self.claude_md_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        new_content = f"{content}\n\n## {section_name}\n\n{formatted_learning}"
-
-        with open(self.claude_md_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
+        # The new section goes at the end, so append instead of rewriting
+        with open(self.claude_md_path, "a", encoding="utf-8") as f:
+            f.write(f"\n\n## {section_name}\n\n{formatted_learning}")
 
         self.success("Learning successfully integrated into CLAUDE.md!")
 
@@ -364,20 +363,12 @@ Context: {repo_name}"""
         self, section: dict, formatted_learning: str, mode: str
     ) -> None:
         """Integrate learning into existing section."""
-        with open(self.claude_md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
+        lines = list(self._lines)
         start_line = section["line_num"] - 1
 
         if mode == "append":
-            # Find end of section
-            end_line = len(lines)
-            for i in range(start_line + 1, len(lines)):
-                if lines[i].startswith("#"):
-                    end_line = i
-                    break
-
             # Insert before next section or at end
+            end_line = self._section_end(start_line)
             lines.insert(end_line, f"\n{formatted_learning}\n")
 
         elif mode == "insert":
@@ -12,7 +12,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import typer
 from rich.panel import Panel
@@ -117,8 +117,10 @@ class SlashCommand(BaseCommand):
             if filename == "slash":
                 continue
 
-            description = self._extract_description(cmd_file)
-            usage = self._extract_usage(cmd_file)
+            # Read each command file once for both the description and usage
+            lines = self._read_lines(cmd_file)
+            description = self._parse_description(lines)
+            usage = self._parse_usage(lines)
 
             # Format the command name
             if usage:
@@ -341,6 +343,22 @@ class SlashCommand(BaseCommand):
 
         return None, ""
 
+    def _read_lines(self, file_path: Path) -> List[str]:
+        """
+        Read a markdown command file.
+
+        Args:
+            file_path: Path to the markdown command file
+
+        Returns:
+            File lines, or an empty list if the file can't be read
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return f.readlines()
+        except Exception:
+            return []
+
     def _extract_description(self, file_path: Path) -> str:
         """
         Extract command description from markdown file.
@@ -351,33 +369,30 @@ class SlashCommand(BaseCommand):
         Returns:
             Extracted description or default text
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Try to get the first line after the title that contains descriptive text
-            if len(lines) >= 3:
-                description = lines[2].strip()
-                if description and len(description) >= 10:
-                    return description
-
-            # If that's empty or too short, look for the Description section
-            in_description = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith("## Description"):
-                    in_description = True
-                    continue
-                if in_description and line.startswith("##"):
-                    break
-                if in_description and line and not line.startswith("#"):
-                    return line[:80]
-
-            # Fallback to a generic description
-            return "Custom claude-slash command"
+        return self._parse_description(self._read_lines(file_path))
+
+    def _parse_description(self, lines: List[str]) -> str:
+        """Extract the command description from markdown file lines."""
+        # Try to get the first line after the title that contains descriptive text
+        if len(lines) >= 3:
+            description = lines[2].strip()
+            if description and len(description) >= 10:
+                return description
+
+        # If that's empty or too short, look for the Description section
+        in_description = False
+        for line in lines:
+            line = line.strip()
+            if line.startswith("## Description"):
+                in_description = True
+                continue
+            if in_description and line.startswith("##"):
+                break
+            if in_description and line and not line.startswith("#"):
+                return line[:80]
 
-        except Exception:
-            return "Custom claude-slash command"
+        # Fallback to a generic description
+        return "Custom claude-slash command"
 
     def _extract_usage(self, file_path: Path) -> str:
         """
@@ -389,25 +404,21 @@ class SlashCommand(BaseCommand):
         Returns:
             Extracted usage string or empty string
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Look for usage in code blocks
-            lines = content.split("\n")
-            in_code_block = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith("```"):
-                    in_code_block = not in_code_block
-                    continue
-                if in_code_block and line.startswith("/"):
-                    return line
-
-            return ""
+        return self._parse_usage(self._read_lines(file_path))
+
+    def _parse_usage(self, lines: List[str]) -> str:
+        """Extract the usage line from markdown file lines."""
+        # Look for usage in code blocks
+        in_code_block = False
+        for line in lines:
+            line = line.strip()
+            if line.startswith("```"):
+                in_code_block = not in_code_block
+                continue
+            if in_code_block and line.startswith("/"):
+                return line
 
-        except Exception:
-            return ""
+        return ""
 
     def _get_timestamp(self) -> str:
         """Get a timestamp string for backup directories."""
@@ -0,0 +1,6 @@
+"""
+Static templates written into repositories created by claude-slash commands.
+
+Templates live here as plain files rather than as string literals in the
+command modules, so they are only read when a command actually needs them.
+"""
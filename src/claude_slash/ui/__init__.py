@@ -32,6 +32,7 @@ from .formatting import (
     format_command_table,
     format_error_message,
     format_info_message,
+    format_message_text,
     format_success_message,
     format_warning_message,
 )
@@ -48,6 +49,7 @@ __all__ = [
     "format_success_message",
     "format_warning_message",
     "format_info_message",
+    "format_message_text",
     "ProgressManager",
     "SpinnerManager",
     "track_operation",
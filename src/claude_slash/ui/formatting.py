@@ -94,6 +94,43 @@ def format_command_table(
     return table
 
 
+# Default prefix and colour for each kind of status message
+_MESSAGE_STYLES = {
+    "error": ("Error", "red"),
+    "success": ("Success", "green"),
+    "warning": ("Warning", "yellow"),
+    "info": ("Info", "blue"),
+}
+
+
+def format_message_text(
+    kind: str, message: str, details: Optional[str] = None, prefix: Optional[str] = None
+) -> Text:
+    """
+    Build a styled status message as Rich Text.
+
+    The text is assembled from styled spans rather than markup, so Rich
+    doesn't have to escape and re-parse it when it is printed.
+
+    Args:
+        kind: Message kind (error, success, warning, info)
+        message: Main message
+        details: Optional detailed information
+        prefix: Prefix text; defaults to the kind's usual prefix
+
+    Returns:
+        Styled Rich Text
+    """
+    default_prefix, color = _MESSAGE_STYLES[kind]
+    if prefix is None:
+        prefix = default_prefix
+    text = Text.assemble((f"{prefix}:", f"bold {color}"), " ", message)
+    if details:
+        text.append("\n")
+        text.append(details, style=f"dim {color}")
+    return text
+
+
 def format_error_message(
     message: str, details: Optional[str] = None, prefix: str = "Error"
 ) -> str:
@@ -108,10 +145,7 @@ def format_error_message(
     Returns:
         Formatted error string with Rich markup
     """
-    formatted = f"[bold red]{prefix}:[/bold red] {escape(message)}"
-    if details:
-        formatted += f"\n[dim red]{escape(details)}[/dim red]"
-    return formatted
+    return format_message_text("error", message, details, prefix).markup
 
 
 def format_success_message(
@@ -128,10 +162,7 @@ def format_success_message(
     Returns:
         Formatted success string with Rich markup
     """
-    formatted = f"[bold green]{prefix}:[/bold green] {escape(message)}"
-    if details:
-        formatted += f"\n[dim green]{escape(details)}[/dim green]"
-    return formatted
+    return format_message_text("success", message, details, prefix).markup
 
 
 def format_warning_message(
@@ -148,10 +179,7 @@ def format_warning_message(
     Returns:
         Formatted warning string with Rich markup
     """
-    formatted = f"[bold yellow]{prefix}:[/bold yellow] {escape(message)}"
-    if details:
-        formatted += f"\n[dim yellow]{escape(details)}[/dim yellow]"
-    return formatted
+    return format_message_text("warning", message, details, prefix).markup
 
 
 def format_info_message(
@@ -168,10 +196,7 @@ def format_info_message(
     Returns:
         Formatted info string with Rich markup
     """
-    formatted = f"[bold blue]{prefix}:[/bold blue] {escape(message)}"
-    if details:
-        formatted += f"\n[dim blue]{escape(details)}[/dim blue]"
-    return formatted
+    return format_message_text("info", message, details, prefix).markup
 
 
 def create_command_help_panel(
@@ -0,0 +1,728 @@
+"""Tests for the github-init command."""
+
+import http.client
+import os
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from claude_slash.commands.github_init import (
+    GitHubInitCommand,
+    GitHubInitialization,
+    GitHubInitOptions,
+    _GITIGNORE_CACHE,
+    _check_prerequisite,
+)
+
+
+class TestGitHubInitCommand:
+    """Test the github-init command implementation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cmd = GitHubInitCommand()
+
+    def test_command_properties(self):
+        """Test basic command properties."""
+        assert self.cmd.name == "github-init"
+        assert "github repository" in self.cmd.help_text.lower()
+
+    def test_missing_repo_name_reports_single_error(self):
+        """Test that an early error exits without being re-reported."""
+        with patch.object(self.cmd, "console") as mock_console:
+            with pytest.raises(typer.Exit):
+                self.cmd.execute(repo_name=None)
+
+        assert mock_console.print.call_count == 1
+        assert "Repository name is required" in mock_console.print.call_args[0][0]
+
+    def test_wrapper_propagates_exit(self):
+        """Test that the Typer wrapper doesn't swallow typer.Exit."""
+        wrapper = self.cmd.create_typer_command()
+
+        with patch(
+            "claude_slash.commands.github_init.GitHubInitialization.execute",
+            side_effect=RuntimeError("boom"),
+        ):
+            with patch.object(self.cmd, "console") as mock_console:
+                with pytest.raises(typer.Exit):
+                    wrapper(repo_name="test-repo")
+
+        assert mock_console.print.call_count == 1
+        assert "boom" in mock_console.print.call_args[0][0]
+
+
+class TestGitHubInitialization:
+    """Test the repository initialization logic."""
+
+    @pytest.fixture(autouse=True)
+    def isolate_environment(self, monkeypatch, tmp_path):
+        """Reset caches and hide any ambient GitHub token."""
+        _check_prerequisite.cache_clear()
+        _GITIGNORE_CACHE.clear()
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        for proxy_var in ("HTTPS_PROXY", "https_proxy", "NO_PROXY", "no_proxy"):
+            monkeypatch.delenv(proxy_var, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    def test_validate_prerequisites_reports_missing_tools(self, tmp_path):
+        """Test that a missing or failing prerequisite raises a clear error."""
+        options = GitHubInitOptions(repo_name=str(tmp_path / "new-repo"))
+        initializer = GitHubInitialization(options)
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "gh":
+                raise FileNotFoundError(cmd[0])
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch(
+            "claude_slash.commands.github_init.subprocess.run", side_effect=fake_run
+        ):
+            with pytest.raises(RuntimeError, match="GitHub CLI"):
+                initializer._validate_prerequisites()
+
+    def test_validate_prerequisites_checks_directory_first(self, tmp_path):
+        """Test that an existing directory fails before any probe runs."""
+        options = GitHubInitOptions(repo_name=str(tmp_path))
+        initializer = GitHubInitialization(options)
+
+        with patch("claude_slash.commands.github_init.subprocess.run") as mock_run:
+            with pytest.raises(RuntimeError, match="already exists"):
+                initializer._validate_prerequisites()
+
+        mock_run.assert_not_called()
+
+    def test_validate_prerequisites_caches_successful_probes(self, tmp_path):
+        """Test that passing probes aren't re-run for later initializations."""
+        options = GitHubInitOptions(repo_name=str(tmp_path / "new-repo"))
+
+        with patch(
+            "claude_slash.commands.github_init.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, "", ""),
+        ) as mock_run:
+            GitHubInitialization(options)._validate_prerequisites()
+            GitHubInitialization(options)._validate_prerequisites()
+
+        assert mock_run.call_count == 2
+
+    def test_validate_prerequisites_with_env_token(self, tmp_path, monkeypatch):
+        """Test that an environment token needs neither gh nor its login."""
+        monkeypatch.setenv("GH_TOKEN", "test-token")
+        options = GitHubInitOptions(repo_name=str(tmp_path / "new-repo"))
+        initializer = GitHubInitialization(options)
+
+        # gh isn't installed at all
+        with patch("claude_slash.commands.github_init.shutil.which", return_value=None):
+            with patch.object(
+                initializer, "_github_api", return_value={"login": "testuser"}
+            ) as mock_api:
+                with patch(
+                    "claude_slash.commands.github_init.subprocess.run",
+                    return_value=subprocess.CompletedProcess([], 0, "", ""),
+                ) as mock_run:
+                    initializer._validate_prerequisites()
+
+        mock_api.assert_called_once_with("GET", "/user")
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["git", "--version"]
+        assert initializer._github_token() == "test-token"
+        assert initializer._get_github_user() == "testuser"
+
+    def test_github_token_asks_gh_for_github_com(self):
+        """Test that gh is asked for the github.com token, not its default host."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch(
+            "claude_slash.commands.github_init.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, b"gho_abc\n", b""),
+        ) as mock_run:
+            assert initializer._github_token() == "gho_abc"
+            assert initializer._github_token() == "gho_abc"
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == [
+            "gh",
+            "auth",
+            "token",
+            "--hostname",
+            "github.com",
+        ]
+
+    def test_get_github_user_uses_rest_api(self):
+        """Test that the username comes from the REST API, not a gh subprocess."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(
+            initializer, "_github_api", return_value={"login": "testuser"}
+        ) as mock_api:
+            assert initializer._get_github_user() == "testuser"
+            assert initializer._get_github_user() == "testuser"
+
+        mock_api.assert_called_once_with("GET", "/user")
+
+    def test_get_github_user_falls_back_to_unknown(self):
+        """Test that API failures don't abort the initialization."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(initializer, "_github_api", side_effect=OSError("offline")):
+            assert initializer._get_github_user() == "unknown"
+
+    def test_create_github_workflows_writes_bundled_ci(self, tmp_path, monkeypatch):
+        """Test that the CI workflow is written from the bundled template."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        initializer._create_github_workflows()
+        initializer._flush_staged_writes()
+
+        ci_workflow = tmp_path / ".github" / "workflows" / "ci.yml"
+        assert ci_workflow.read_text().startswith("name: CI\n")
+        assert ".github/workflows/ci.yml" in initializer.created_files
+
+    def test_create_github_project_uses_graphql(self, tmp_path, monkeypatch):
+        """Test that the project board is created through GraphQL."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+        initializer._owner_node_id = "U_owner"
+        initializer._repo_node_id = "R_repo"
+        responses = [
+            {"data": {"createProjectV2": {"projectV2": {"id": "PVT_1"}}}},
+            {"data": {"updateProjectV2": {"projectV2": {"id": "PVT_1"}}}},
+        ]
+
+        with patch.object(
+            initializer, "_github_api", side_effect=responses
+        ) as mock_api:
+            with patch.object(initializer, "_create_outcome_labels"):
+                initializer._create_github_project()
+
+        create, update = [call.args for call in mock_api.call_args_list]
+        assert create[:2] == ("POST", "/graphql")
+        assert create[2]["variables"] == {
+            "ownerId": "U_owner",
+            "title": "test-repo Development",
+            "repositoryId": "R_repo",
+        }
+        assert update[2]["variables"]["projectId"] == "PVT_1"
+
+    def test_github_graphql_raises_on_errors(self):
+        """Test that GraphQL errors surface as a RuntimeError."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(
+            initializer,
+            "_github_api",
+            return_value={"errors": [{"message": "Resource not accessible"}]},
+        ):
+            with pytest.raises(RuntimeError, match="Resource not accessible"):
+                initializer._github_graphql("query { viewer { id } }")
+
+    def test_github_api_reuses_connection(self, monkeypatch):
+        """Test that consecutive API calls share one keep-alive connection."""
+        monkeypatch.setenv("GH_TOKEN", "token")
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch("http.client.HTTPSConnection") as mock_conn_cls:
+            mock_conn_cls.return_value.sock = None
+            response = mock_conn_cls.return_value.getresponse.return_value
+            response.status = 200
+            response.read.return_value = b'{"login": "octocat"}'
+
+            assert initializer._github_api("GET", "/user") == {"login": "octocat"}
+            assert initializer._github_api("GET", "/user") == {"login": "octocat"}
+            initializer._close_connections()
+
+        mock_conn_cls.assert_called_once_with("api.github.com", timeout=30)
+        assert mock_conn_cls.return_value.request.call_count == 2
+        mock_conn_cls.return_value.close.assert_called_once()
+
+    def test_github_api_tunnels_through_https_proxy(self, monkeypatch):
+        """Test that HTTPS_PROXY is honored with a CONNECT tunnel."""
+        monkeypatch.setenv("GH_TOKEN", "token")
+        monkeypatch.setenv("HTTPS_PROXY", "http://user:pw@proxy.example:3128")
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch("http.client.HTTPSConnection") as mock_conn_cls:
+            response = mock_conn_cls.return_value.getresponse.return_value
+            response.status = 204
+            response.read.return_value = b""
+            initializer._github_api("DELETE", "/repos/octocat/test-repo")
+
+        mock_conn_cls.assert_called_once_with("proxy.example", 3128, timeout=30)
+        mock_conn_cls.return_value.set_tunnel.assert_called_once_with(
+            "api.github.com", 443, headers={"Proxy-Authorization": "Basic dXNlcjpwdw=="}
+        )
+
+    def test_github_api_rejects_proxy_without_host(self, monkeypatch):
+        """Test that a malformed HTTPS_PROXY is reported by name."""
+        monkeypatch.setenv("GH_TOKEN", "token")
+        monkeypatch.setenv("HTTPS_PROXY", "http://:3128")
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch("http.client.HTTPSConnection") as mock_conn_cls:
+            with pytest.raises(ValueError, match="'http://:3128' has no host"):
+                initializer._github_api("GET", "/user")
+
+        mock_conn_cls.assert_not_called()
+
+    def test_execute_reports_github_error_message(self, monkeypatch, capsys):
+        """Test that GitHub's reason for a 422 reaches the user."""
+        monkeypatch.setenv("GH_TOKEN", "token")
+        options = GitHubInitOptions(
+            repo_name="test-repo",
+            create_project=False,
+            enable_dependabot=False,
+            enable_branch_protection=False,
+            install_claude_app=False,
+        )
+        initializer = GitHubInitialization(options)
+        module = "claude_slash.commands.github_init.GitHubInitialization"
+        steps = [
+            "_validate_prerequisites",
+            "_init_git_repo",
+            "_create_initial_files",
+            "_create_github_workflows",
+            "_rollback",
+        ]
+        patches = [patch(f"{module}.{step}") for step in steps]
+        for p in patches:
+            p.start()
+        try:
+            with patch("http.client.HTTPSConnection") as mock_conn_cls:
+                response = mock_conn_cls.return_value.getresponse.return_value
+                response.status = 422
+                response.reason = "Unprocessable Entity"
+                response.read.return_value = (
+                    b'{"message": "Repository creation failed.", '
+                    b'"errors": [{"resource": "Repository", "code": "custom", '
+                    b'"message": "name already exists on this account"}]}'
+                )
+                with pytest.raises(OSError, match="name already exists"):
+                    initializer.execute()
+        finally:
+            for p in patches:
+                p.stop()
+
+        out = capsys.readouterr().out
+        assert (
+            "HTTP Error 422: Unprocessable Entity: Repository creation failed.; "
+            "name already exists on this account"
+        ) in out
+
+    def test_github_api_retries_only_idempotent_requests(self, monkeypatch):
+        """Test that a dropped connection is retried for GET but not POST."""
+        monkeypatch.setenv("GH_TOKEN", "token")
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch("http.client.HTTPSConnection") as mock_conn_cls:
+            conn = mock_conn_cls.return_value
+            conn.sock = None
+            conn.getresponse.return_value.status = 200
+            conn.getresponse.return_value.read.return_value = b"{}"
+            conn.request.side_effect = [
+                None,
+                ConnectionResetError(),
+                None,
+                ConnectionResetError(),
+            ]
+
+            initializer._github_api("GET", "/user")
+            # The pooled connection drops; the GET is re-sent on a new one
+            initializer._github_api("GET", "/user")
+            assert mock_conn_cls.call_count == 2
+
+            # A POST may already have been applied, so it is not re-sent
+            with pytest.raises(ConnectionResetError):
+                initializer._github_api("POST", "/user/repos", {"name": "x"})
+            assert mock_conn_cls.call_count == 2
+
+    def test_setup_branch_protection_uses_rest_api(self):
+        """Test that branch protection is applied with one REST call."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(initializer, "_get_github_user", return_value="octocat"):
+            with patch.object(initializer, "_github_api") as mock_api:
+                initializer._setup_branch_protection()
+
+        method, path, body = mock_api.call_args.args
+        assert (method, path) == (
+            "PUT",
+            "/repos/octocat/test-repo/branches/main/protection",
+        )
+        reviews = body["required_pull_request_reviews"]
+        assert reviews["required_approving_review_count"] == 1
+        assert body["allow_force_pushes"] is False
+
+    def test_init_git_repo_names_initial_branch(self, tmp_path, monkeypatch):
+        """Test that the branch is set by git init, with a fallback for old git."""
+        monkeypatch.chdir(tmp_path)
+        options = GitHubInitOptions(repo_name="new-repo", default_branch="trunk")
+
+        def fake_run(cmd, check=False, **kwargs):
+            if cmd[:3] == ["git", "init", "-b"]:
+                raise subprocess.CalledProcessError(129, cmd)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        with patch(
+            "claude_slash.commands.github_init.subprocess.run", side_effect=fake_run
+        ) as mock_run:
+            GitHubInitialization(options)._init_git_repo()
+
+        assert [call.args[0] for call in mock_run.call_args_list] == [
+            ["git", "init", "-b", "trunk"],
+            ["git", "init"],
+            ["git", "branch", "-M", "trunk"],
+        ]
+
+    def test_initial_commit_and_push_stages_created_files(self):
+        """Test that only generated files are staged before commit and push."""
+        options = GitHubInitOptions(repo_name="my repo", default_branch="main")
+        initializer = GitHubInitialization(options)
+        initializer.created_files = ["README.md", ".github/workflows/ci.yml"]
+
+        with patch.object(initializer, "_get_github_user", return_value="testuser"):
+            with patch("claude_slash.commands.github_init.subprocess.run") as mock_run:
+                initializer._initial_commit_and_push()
+
+        assert [call.args[0] for call in mock_run.call_args_list] == [
+            ["git", "add", "--", "README.md", ".github/workflows/ci.yml"],
+            ["git", "commit", "-m", "Initial commit"],
+            ["git", "remote", "add", "origin", "git@github.com:testuser/my repo.git"],
+            ["git", "push", "-u", "origin", "main"],
+        ]
+
+    def test_execute_closes_connections_when_validation_fails(self):
+        """Test that a failed prerequisite check doesn't leak API connections."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(
+            initializer,
+            "_validate_prerequisites",
+            side_effect=RuntimeError("token could not be verified"),
+        ):
+            with patch.object(initializer, "_close_connections") as mock_close:
+                with patch.object(initializer, "_rollback") as mock_rollback:
+                    with pytest.raises(RuntimeError):
+                        initializer.execute()
+
+        mock_close.assert_called_once()
+        mock_rollback.assert_not_called()
+
+    def test_dry_run_preview(self, capsys):
+        """Test that the dry run prints the full preview."""
+        options = GitHubInitOptions(
+            repo_name="test-repo", description="A test", dry_run=True
+        )
+
+        GitHubInitialization(options).execute()
+
+        output = capsys.readouterr().out
+        assert output.startswith("🔍 DRY RUN MODE")
+        assert "📦 Repository name: test-repo" in output
+        assert "📝 Description: A test" in output
+        assert "📜 License" not in output
+        assert output.endswith("📊 Outcome metrics dashboard\n")
+
+    def test_generated_files_respect_umask(self, tmp_path, monkeypatch):
+        """Test that generated files get open()'s umask-based permissions."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+        initializer._stage("README.md", "# test-repo\n")
+
+        old_umask = os.umask(0o002)
+        try:
+            initializer._flush_staged_writes()
+        finally:
+            os.umask(old_umask)
+
+        assert (tmp_path / "README.md").stat().st_mode & 0o777 == 0o664
+
+    def test_create_project_automation_writes_bundled_workflows(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that the automation workflows are written from bundled templates."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        initializer._create_project_automation()
+        initializer._flush_staged_writes()
+
+        workflow_dir = tmp_path / ".github" / "workflows"
+        automation = (workflow_dir / "project-automation.yml").read_text()
+        assert r"/\*\*Parent Outcome:\*\* #(\d+)/" in automation
+        assert (workflow_dir / "outcome-metrics.yml").exists()
+        assert initializer.created_files == [
+            ".github/workflows/project-automation.yml",
+            ".github/workflows/outcome-metrics.yml",
+        ]
+
+    def test_create_license_uses_current_year(self, tmp_path, monkeypatch):
+        """Test that the license is rendered from the bundled MIT template."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(
+            GitHubInitOptions(repo_name="test-repo", license="MIT")
+        )
+
+        with patch.object(initializer, "_get_github_user", return_value="testuser"):
+            initializer._create_license()
+        initializer._flush_staged_writes()
+
+        content = (tmp_path / "LICENSE").read_text()
+        year = time.localtime().tm_year
+        assert content.startswith(f"MIT License\n\nCopyright (c) {year} testuser\n")
+        assert initializer.created_files == ["LICENSE"]
+
+    def test_create_outcome_labels_updates_existing(self):
+        """Test that every label is created, falling back to edit on conflict."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        def fake_api(method, path, body=None):
+            if method == "POST" and body["name"] == "epic":
+                raise OSError("HTTP Error 422: Unprocessable Entity")
+
+        with patch.object(initializer, "_get_github_user", return_value="octocat"):
+            with patch.object(
+                initializer, "_github_api", side_effect=fake_api
+            ) as mock_api:
+                initializer._create_outcome_labels()
+
+        calls = sorted(call.args[:2] for call in mock_api.call_args_list)
+        assert calls == [
+            ("PATCH", "/repos/octocat/test-repo/labels/epic"),
+            ("POST", "/repos/octocat/test-repo/labels"),
+            ("POST", "/repos/octocat/test-repo/labels"),
+            ("POST", "/repos/octocat/test-repo/labels"),
+        ]
+
+    def test_create_outcome_labels_warns_on_broken_responses(self, capsys):
+        """Test that a protocol error on a label is a warning, not a failure."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(initializer, "_get_github_user", return_value="octocat"):
+            with patch.object(
+                initializer,
+                "_github_api",
+                side_effect=http.client.IncompleteRead(b""),
+            ):
+                initializer._create_outcome_labels()
+
+        out = capsys.readouterr().out
+        for name in ("outcome", "epic", "story"):
+            assert f"Could not create label '{name}'" in out
+
+    def test_get_github_user_tolerates_protocol_errors(self):
+        """Test that a broken API response falls back to "unknown"."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(
+            initializer,
+            "_github_api",
+            side_effect=http.client.BadStatusLine("garbage"),
+        ):
+            assert initializer._get_github_user() == "unknown"
+
+    def test_create_github_repo_uses_rest_api(self):
+        """Test that the repository is created with one REST call."""
+        options = GitHubInitOptions(
+            repo_name="test-repo", description="A test", private=True
+        )
+        initializer = GitHubInitialization(options)
+
+        with patch.object(
+            initializer, "_github_api", return_value={"owner": {"login": "octocat"}}
+        ) as mock_api:
+            with patch("claude_slash.commands.github_init.subprocess.run") as mock_run:
+                initializer._create_github_repo()
+                assert initializer._get_github_user() == "octocat"
+
+        mock_api.assert_called_once_with(
+            "POST",
+            "/user/repos",
+            {"name": "test-repo", "private": True, "description": "A test"},
+        )
+        mock_run.assert_not_called()
+
+    def test_create_gitignore_caches_fetched_template(self, tmp_path, monkeypatch):
+        """Test that a fetched gitignore template is reused across runs."""
+        monkeypatch.chdir(tmp_path)
+        options = GitHubInitOptions(repo_name="test-repo", gitignore="Python")
+
+        with patch.object(
+            GitHubInitialization,
+            "_github_api",
+            return_value={"source": "__pycache__/\n"},
+        ) as mock_api:
+            for _ in range(2):
+                initializer = GitHubInitialization(options)
+                initializer._create_gitignore()
+                initializer._flush_staged_writes()
+
+        mock_api.assert_called_once_with("GET", "/gitignore/templates/Python")
+        assert (tmp_path / ".gitignore").read_text() == "__pycache__/\n"
+
+    def test_create_gitignore_reuses_disk_cache(self, tmp_path, monkeypatch):
+        """Test that a template fetched by an earlier run skips the API."""
+        monkeypatch.chdir(tmp_path)
+        options = GitHubInitOptions(repo_name="test-repo", gitignore="Node")
+
+        with patch.object(
+            GitHubInitialization, "_github_api", return_value={"source": "dist/\n"}
+        ):
+            GitHubInitialization(options)._create_gitignore()
+
+        # Simulate a new process: the in-memory cache is gone
+        _GITIGNORE_CACHE.clear()
+        initializer = GitHubInitialization(options)
+        with patch.object(GitHubInitialization, "_github_api") as mock_api:
+            initializer._create_gitignore()
+        initializer._flush_staged_writes()
+
+        mock_api.assert_not_called()
+        assert (tmp_path / ".gitignore").read_text() == "dist/\n"
+        cached = tmp_path / "cache" / "claude-slash" / "gitignore" / "Node.gitignore"
+        assert cached.read_text() == "dist/\n"
+
+    def test_create_gitignore_falls_back_to_basic(self, tmp_path, monkeypatch):
+        """Test that the bundled basic gitignore is used without a template."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        initializer._create_gitignore()
+        initializer._flush_staged_writes()
+
+        content = (tmp_path / ".gitignore").read_text()
+        assert content.startswith("# Byte-compiled / optimized / DLL files\n")
+        assert initializer.created_files == [".gitignore"]
+
+    def test_rollback_removes_local_and_remote_repo(self, tmp_path, monkeypatch):
+        """Test that rollback deletes the local tree and the GitHub repo."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "test-repo" / "docs").mkdir(parents=True)
+        (tmp_path / "test-repo" / "docs" / "index.md").write_text("# Docs\n")
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+        initializer._repo_created = True
+
+        with patch.object(initializer, "_get_github_user", return_value="octocat"):
+            with patch.object(initializer, "_github_api") as mock_api:
+                initializer._rollback()
+
+        mock_api.assert_called_once_with("DELETE", "/repos/octocat/test-repo")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rollback_warns_when_local_tree_remains(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """Test that a local directory rmtree couldn't remove is reported."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "test-repo").mkdir()
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch("claude_slash.commands.github_init.shutil.rmtree"):
+            initializer._rollback()
+
+        assert "Could not fully remove 'test-repo'" in capsys.readouterr().out
+        assert [path.name for path in tmp_path.iterdir()] == ["test-repo"]
+
+    def test_rollback_keeps_remote_repo_it_did_not_create(self, tmp_path, monkeypatch):
+        """Test that a failed create never deletes an existing GitHub repo."""
+        monkeypatch.chdir(tmp_path)
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+
+        with patch.object(
+            initializer, "_github_api", side_effect=OSError("422 name exists")
+        ) as mock_api:
+            with pytest.raises(OSError):
+                initializer._create_github_repo()
+            initializer._rollback()
+
+        mock_api.assert_called_once()
+        assert mock_api.call_args.args[:2] == ("POST", "/user/repos")
+
+    def test_execute_runs_remote_setup_and_propagates_failures(self):
+        """Test that a failing concurrent setup step still triggers rollback."""
+        options = GitHubInitOptions(repo_name="test-repo", create_project=True)
+        initializer = GitHubInitialization(options)
+        module = "claude_slash.commands.github_init.GitHubInitialization"
+        steps = [
+            "_validate_prerequisites",
+            "_init_git_repo",
+            "_create_initial_files",
+            "_create_github_workflows",
+            "_create_github_repo",
+            "_setup_dependabot",
+            "_install_claude_app",
+            "_setup_branch_protection",
+            "_initial_commit_and_push",
+            "_rollback",
+        ]
+        patches = {step: patch(f"{module}.{step}") for step in steps}
+        mocks = {step: p.start() for step, p in patches.items()}
+        try:
+            with patch(
+                f"{module}._create_github_project",
+                side_effect=RuntimeError("project failed"),
+            ):
+                with pytest.raises(RuntimeError, match="project failed"):
+                    initializer.execute()
+        finally:
+            for p in patches.values():
+                p.stop()
+
+        mocks["_setup_dependabot"].assert_called_once()
+        mocks["_install_claude_app"].assert_called_once()
+        mocks["_setup_branch_protection"].assert_called_once()
+        mocks["_initial_commit_and_push"].assert_not_called()
+        mocks["_rollback"].assert_called_once()
+
+    def test_execute_overlaps_repo_creation_with_local_files(self):
+        """Test that a failed repo creation is reported after local setup."""
+        initializer = GitHubInitialization(GitHubInitOptions(repo_name="test-repo"))
+        module = "claude_slash.commands.github_init.GitHubInitialization"
+        steps = [
+            "_validate_prerequisites",
+            "_init_git_repo",
+            "_create_initial_files",
+            "_create_github_workflows",
+            "_create_github_project",
+            "_rollback",
+        ]
+        patches = {step: patch(f"{module}.{step}") for step in steps}
+        mocks = {step: p.start() for step, p in patches.items()}
+        try:
+            with patch(
+                f"{module}._create_github_repo",
+                side_effect=OSError("name already exists"),
+            ):
+                with pytest.raises(OSError, match="name already exists"):
+                    initializer.execute()
+        finally:
+            for p in patches.values():
+                p.stop()
+
+        mocks["_create_initial_files"].assert_called_once()
+        mocks["_create_github_workflows"].assert_called_once()
+        mocks["_create_github_project"].assert_not_called()
+        mocks["_rollback"].assert_called_once()
+
+
+class TestGitHubInitOptionsResolution:
+    """Test how command arguments map onto initialization options."""
+
+    def test_unset_arguments_use_option_defaults(self):
+        """Test that omitted arguments keep the dataclass defaults."""
+        cmd = GitHubInitCommand()
+
+        with patch(
+            "claude_slash.commands.github_init.GitHubInitialization"
+        ) as mock_init:
+            with patch.object(cmd, "console"):
+                cmd.execute(repo_name="test-repo", public=True, create_project=False)
+
+        options = mock_init.call_args[0][0]
+        assert options == GitHubInitOptions(
+            repo_name="test-repo", private=False, create_project=False
+        )
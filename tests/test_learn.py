@@ -0,0 +1,87 @@
+"""Tests for the learn command's CLAUDE.md integration."""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from claude_slash.commands.learn import LearnCommand
+
+CLAUDE_MD = "# Top\nintro\n## A\na1\n## B\nb1\n"
+
+
+class TestLearnIntegration:
+    """Test how learnings are written into CLAUDE.md."""
+
+    @pytest.fixture
+    def learn_cmd(self, tmp_path):
+        """Create a learn command pointed at a temporary CLAUDE.md."""
+        cmd = LearnCommand()
+        cmd.claude_md_path = tmp_path / "CLAUDE.md"
+        cmd.claude_md_path.write_text(CLAUDE_MD, encoding="utf-8")
+        cmd.console = Console(file=io.StringIO())
+        return cmd
+
+    def _section(self, cmd, header):
+        """Parse CLAUDE.md and return the section with the given header."""
+        sections = cmd._parse_claude_md_structure()
+        return next(section for section in sections if section["header"] == header)
+
+    def test_parse_structure_limits_sections(self, learn_cmd):
+        """Test that headers are found with line numbers, capped at 20."""
+        sections = learn_cmd._parse_claude_md_structure()
+        assert [(s["line_num"], s["header"]) for s in sections] == [
+            (1, "# Top"),
+            (3, "## A"),
+            (5, "## B"),
+        ]
+
+        learn_cmd.claude_md_path.write_text(
+            "".join(f"## S{i}\nx\n" for i in range(25)), encoding="utf-8"
+        )
+        assert len(learn_cmd._parse_claude_md_structure()) == 20
+
+    def test_append_to_section(self, learn_cmd):
+        """Test that append mode inserts before the next header."""
+        section = self._section(learn_cmd, "## A")
+        learn_cmd._integrate_existing_section(section, "LEARN", "append")
+
+        assert learn_cmd.claude_md_path.read_text(encoding="utf-8") == (
+            "# Top\nintro\n## A\na1\n\nLEARN\n## B\nb1\n"
+        )
+
+    def test_append_to_last_section(self, learn_cmd):
+        """Test that appending to the last section writes at end of file."""
+        section = self._section(learn_cmd, "## B")
+        learn_cmd._integrate_existing_section(section, "LEARN", "append")
+
+        assert learn_cmd.claude_md_path.read_text(encoding="utf-8") == (
+            CLAUDE_MD + "\nLEARN\n"
+        )
+
+    def test_insert_after_header(self, learn_cmd):
+        """Test that insert mode writes right after the section header."""
+        section = self._section(learn_cmd, "## A")
+        learn_cmd._integrate_existing_section(section, "LEARN", "insert")
+
+        assert learn_cmd.claude_md_path.read_text(encoding="utf-8") == (
+            "# Top\nintro\n## A\n\nLEARN\na1\n## B\nb1\n"
+        )
+
+    def test_new_section_is_appended(self, learn_cmd):
+        """Test that a new section is added at the end of the file."""
+        learn_cmd._parse_claude_md_structure()
+        learn_cmd._integrate_new_section("Z", "LEARN\n")
+
+        assert learn_cmd.claude_md_path.read_text(encoding="utf-8") == (
+            CLAUDE_MD + "\n\n## Z\n\nLEARN\n"
+        )
+
+    def test_manual_integration_shows_only_the_section(self, learn_cmd):
+        """Test that the manual view shows the section up to the next header."""
+        section = self._section(learn_cmd, "## A")
+        learn_cmd._show_manual_integration(section, "LEARN")
+
+        output = learn_cmd.console.file.getvalue()
+        assert "a1" in output
+        assert "b1" not in output
@@ -5,10 +5,13 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import typer
+from rich.console import Console
 from typer.testing import CliRunner
 
 from claude_slash.commands.base import BaseCommand
 from claude_slash.main import app, discover_commands, register_commands
+from claude_slash.ui import format_warning_message
 
 
 class MockCommand(BaseCommand):
@@ -170,6 +173,19 @@ class TestBaseCommand:
         assert hasattr(cmd, "info")
         assert hasattr(cmd, "warning")
 
+    def test_message_helpers_match_markup_formatting(self):
+        """Test that message helpers render like the markup formatters."""
+        cmd = MockCommand()
+        cmd.console = Console(record=True, width=80)
+        expected = Console(record=True, width=80)
+
+        cmd.warning("Check [config] value 42", "See docs")
+        expected.print(format_warning_message("Check [config] value 42", "See docs"))
+
+        output = cmd.console.export_text()
+        assert output == expected.export_text()
+        assert output == "Warning: Check [config] value 42\nSee docs\n"
+
     def test_create_typer_command_wrapper(self):
         """Test that create_typer_command creates a valid wrapper."""
         cmd = MockCommand()
@@ -180,6 +196,18 @@ class TestBaseCommand:
         assert wrapper.__doc__ == "Mock command for testing"
 
 
+    def test_create_typer_command_wrapper_reports_error_once(self):
+        """Test that an error reported by the command isn't reported again."""
+        cmd = MockCommand()
+        cmd.console = Console(record=True, width=80)
+        wrapper = cmd.create_typer_command()
+
+        with patch.object(cmd, "execute", side_effect=lambda: cmd.error("Boom")):
+            with pytest.raises(typer.Exit):
+                wrapper()
+
+        assert cmd.console.export_text() == "Error: Boom\n"
+
 class TestSubprocessMocking:
     """Test subprocess mocking capabilities."""
 